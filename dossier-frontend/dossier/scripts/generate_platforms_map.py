@@ -14,10 +14,19 @@ Heuristics:
 
 import json
 import re
+import string
 import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from urllib.request import urlopen
 
+# orjson is optional; the script still runs with only the standard library
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 ROOT = Path(__file__).resolve().parents[1]
 LOCAL_PLATFORMS = ROOT / "src/lib/platforms.json"
 OUT_PATH = ROOT / "src/lib/platforms_map.json"
@@ -27,67 +36,104 @@ SHERLOCK_URLS = [
 ]
 
 
+# characters kept by normalize(); everything else is punctuation to strip
+_PUNCT_RE = re.compile(r"[^a-z0-9]")
+_KEEP = frozenset(string.ascii_lowercase + string.digits)
+_PUNCT_TABLE = str.maketrans(
+    "", "", "".join(chr(c) for c in range(128) if chr(c) not in _KEEP)
+)
+
+
 def normalize(s: str) -> str:
-    s = s or ""
-    s = s.lower()
-    s = s.replace("&", "and")
-    # remove punctuation except alnum
-    s = re.sub(r"[^a-z0-9]", "", s)
-    return s
+    s = (s or "").lower().replace("&", "and")
+    # remove punctuation except alnum; translate covers ASCII without the
+    # regex engine, other input falls back to the precompiled pattern
+    if s.isascii():
+        return s.translate(_PUNCT_TABLE)
+    return _PUNCT_RE.sub("", s)
+
+
+def loads(raw: bytes):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
+def dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _fetch_json(url):
+    with urlopen(url, timeout=15) as r:
+        return loads(r.read())
 
 
 def load_sherlock_data():
+    # race the mirrors and take the first successful response
     last_err = None
-    for url in SHERLOCK_URLS:
-        try:
-            with urlopen(url, timeout=15) as r:
-                raw = r.read().decode("utf-8")
-                data = json.loads(raw)
-                return data
-        except Exception as e:
-            last_err = e
+    ex = ThreadPoolExecutor(max_workers=len(SHERLOCK_URLS))
+    try:
+        futures = [ex.submit(_fetch_json, url) for url in SHERLOCK_URLS]
+        for fut in as_completed(futures):
+            try:
+                return fut.result()
+            except Exception as e:
+                last_err = e
+    finally:
+        # don't block on the slower mirror once we have an answer
+        ex.shutdown(wait=False, cancel_futures=True)
     raise RuntimeError(f"Failed to fetch sherlock data.json: {last_err}")
 
 
+def _resolve(display_norm, index):
+    # Callers try ci_index first, and it covers every sherlock key, so no
+    # candidate here can be a case-insensitive match; just break ties.
+    candidates = index.get(display_norm, ())
+    if len(candidates) == 1:
+        return candidates[0]
+    if len(candidates) > 1:
+        # prefer shortest key (likely the slug-like one)
+        return min(candidates, key=len)
+    return None
+
+
 def main():
     if not LOCAL_PLATFORMS.exists():
         print(f"Local platforms file not found: {LOCAL_PLATFORMS}")
         sys.exit(2)
 
-    local = json.loads(LOCAL_PLATFORMS.read_text())
-    sherlock = load_sherlock_data()
+    # overlap the network fetch with reading the local file
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        sherlock_future = ex.submit(load_sherlock_data)
+        local = loads(LOCAL_PLATFORMS.read_bytes())
+        sherlock = sherlock_future.result()
     sherlock_keys = list(sherlock.keys())
 
     # build normalization index for sherlock keys
-    index = {}
+    index = defaultdict(list)
+    for k in sherlock_keys:
+        index[normalize(k)].append(k)
+    # case-insensitive index; first key wins, matching the old linear scan
+    ci_index = {}
     for k in sherlock_keys:
-        nk = normalize(k)
-        index.setdefault(nk, []).append(k)
+        ci_index.setdefault(k.lower(), k)
 
     mapping = {}
     unmatched = []
 
-    for display in local:
-        # try case-insensitive exact
-        found = None
-        for k in sherlock_keys:
-            if k.lower() == str(display).lower():
-                found = k
-                break
-        if not found:
-            nd = normalize(display)
-            candidates = index.get(nd) or []
-            if len(candidates) == 1:
-                found = candidates[0]
-            elif len(candidates) > 1:
-                # prefer exact case-insensitive if present
-                for c in candidates:
-                    if c.lower() == str(display).lower():
-                        found = c
-                        break
-                if not found:
-                    # prefer shortest key (likely the slug-like one)
-                    found = sorted(candidates, key=len)[0]
+    # precompute per-display lookups once, outside the matching loop
+    local_ci = [str(d).lower() for d in local]
+    local_norms = [normalize(d) for d in local]
+
+    for i, display in enumerate(local):
+        # exact key: nothing to normalize
+        if display in sherlock:
+            found = display
+        else:
+            # try case-insensitive exact, then the normalized index
+            found = ci_index.get(local_ci[i]) or _resolve(local_norms[i], index)
 
         if not found:
             mapping[display] = None
@@ -95,7 +141,7 @@ def main():
         else:
             mapping[display] = found
 
-    OUT_PATH.write_text(json.dumps(mapping, indent=2, ensure_ascii=False))
+    OUT_PATH.write_bytes(dumps(mapping))
     print(f"Wrote {OUT_PATH}")
     if unmatched:
         print(f"Unmatched ({len(unmatched)}):\n" + ", ".join(unmatched[:200]))
@@ -3,33 +3,165 @@
 from typing import Any
 
 import httpx
+import orjson
+from aiolimiter import AsyncLimiter
+from async_lru import alru_cache
 from fastapi import APIRouter, HTTPException, Query
+from pydantic import TypeAdapter
 
 from dossier.schemas import AddressSchema
 
 router = APIRouter()
 
+# Dumps a whole result list in one pydantic-core call
+_RESULTS_ADAPTER = TypeAdapter(list[AddressSchema])
 
-def parse_nominatim_result(data: dict[str, Any]) -> AddressSchema:
-    """Parse a Nominatim API result into an AddressSchema."""
+NOMINATIM_SEARCH_URL = "https://nominatim.openstreetmap.org/search"
+NOMINATIM_REVERSE_URL = "https://nominatim.openstreetmap.org/reverse"
+# Nominatim's usage policy requires an identifying User-Agent
+NOMINATIM_HEADERS = {"User-Agent": "Dossier-App/1.0 (contact: admin@example.com)"}
+
+# Geocoding results rarely change, so keep them for a day. This collapses
+# repeated lookups to a dict access and keeps us under Nominatim's 1 req/s limit.
+_CACHE_MAXSIZE = 4096
+_CACHE_TTL = 86400
+# Decimal places kept on reverse-geocode coordinates (~1.1 m at the equator)
+_COORD_PRECISION = 5
+
+# Nominatim's usage policy allows one request per second per application. The
+# alru caches below already coalesce concurrent identical lookups onto a single
+# in-flight call, so only distinct queries queue here.
+_rate_limiter = AsyncLimiter(1, 1.05)
+
+# Shared client so connections to Nominatim are kept alive between requests;
+# created at application startup and closed at shutdown (see dossier.main).
+_client: httpx.AsyncClient | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared Nominatim client, creating it if startup hasn't run."""
+    global _client  # noqa: PLW0603
+    if _client is None:
+        _client = httpx.AsyncClient(
+            http2=True,
+            timeout=10.0,
+            headers=NOMINATIM_HEADERS,
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
+    return _client
+
+
+async def open_client() -> None:
+    """Create the shared Nominatim client (application startup hook)."""
+    _get_client()
+
+
+async def close_client() -> None:
+    """Close the shared Nominatim client (application shutdown hook)."""
+    global _client  # noqa: PLW0603
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+async def _nominatim_get(url: str, params: dict[str, Any]) -> httpx.Response:
+    """GET a Nominatim endpoint under the shared rate limit."""
+    async with _rate_limiter:
+        response = await _get_client().get(url, params=params)
+    response.raise_for_status()
+    return response
+
+
+def _extract_fields(data: dict[str, Any]) -> dict[str, Any]:
+    """Map a Nominatim result onto the AddressSchema fields as a plain dict.
+
+    The output already matches the schema types, so callers can use it as-is
+    or pass it to `AddressSchema.model_construct` without re-validating.
+    """
     # Extract structured address components
     address = data.get("address", {})
+    lat = data.get("lat")
+    lon = data.get("lon")
+    osm_id = data.get("osm_id")
+
+    return {
+        "display_name": data.get("display_name", ""),
+        "house_number": address.get("house_number"),
+        "road": address.get("road"),
+        "city": address.get("city") or address.get("town") or address.get("village"),
+        "state": address.get("state"),
+        "postcode": address.get("postcode"),
+        "country": address.get("country"),
+        "country_code": address.get("country_code"),
+        "lat": float(lat) if lat else None,
+        "lon": float(lon) if lon else None,
+        "place_id": data.get("place_id"),
+        "osm_type": data.get("osm_type"),
+        # Nominatim returns numeric ids; the schema stores them as strings
+        "osm_id": str(osm_id) if osm_id is not None else None,
+    }
+
+
+def parse_nominatim_result(data: dict[str, Any]) -> AddressSchema:
+    """Parse a Nominatim API result into an AddressSchema."""
+    return AddressSchema(**_extract_fields(data))
+
+
+@alru_cache(maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL)
+async def _nominatim_search(
+    q: str,
+    limit: int,
+    country_codes: str | None,
+) -> list[dict[str, Any]]:
+    """Query Nominatim search with normalized inputs and return parsed results.
+
+    Results are cached; httpx errors propagate to the caller and are not cached.
+    """
+    # No extratags: _extract_fields never reads them and they dominate the payload
+    params = {
+        "q": q,
+        "format": "json",
+        "addressdetails": 1,
+        "limit": limit,
+    }
+    if country_codes:
+        params["countrycodes"] = country_codes
+
+    response = await _nominatim_get(NOMINATIM_SEARCH_URL, params)
 
-    return AddressSchema(
-        display_name=data.get("display_name", ""),
-        lat=float(data.get("lat", 0)) if data.get("lat") else None,
-        lon=float(data.get("lon", 0)) if data.get("lon") else None,
-        place_id=data.get("place_id"),
-        osm_type=data.get("osm_type"),
-        osm_id=data.get("osm_id"),
-        house_number=address.get("house_number"),
-        road=address.get("road"),
-        city=address.get("city") or address.get("town") or address.get("village"),
-        state=address.get("state"),
-        postcode=address.get("postcode"),
-        country=address.get("country"),
-        country_code=address.get("country_code"),
-    )
+    # Convert to structured results. _extract_fields already yields the schema
+    # types, so rows are built without re-validation; a malformed item is
+    # skipped rather than failing the whole search.
+    rows = []
+    for item in orjson.loads(response.content):
+        try:
+            rows.append(AddressSchema.model_construct(**_extract_fields(item)))
+        except (ValueError, KeyError):
+            # Skip malformed results
+            continue
+    return _RESULTS_ADAPTER.dump_python(rows)
+
+
+@alru_cache(maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL)
+async def _nominatim_reverse(lat: float, lon: float) -> dict[str, Any] | None:
+    """Reverse geocode coordinates via Nominatim and return the parsed address.
+
+    Returns None when Nominatim has no address for the coordinates. Results are
+    cached; httpx and parsing errors propagate to the caller and are not cached.
+    """
+    params = {
+        "lat": lat,
+        "lon": lon,
+        "format": "json",
+        "addressdetails": 1,
+    }
+
+    response = await _nominatim_get(NOMINATIM_REVERSE_URL, params)
+
+    data = orjson.loads(response.content)
+    if not data:
+        return None
+    return AddressSchema.model_construct(**_extract_fields(data)).model_dump()
 
 
 @router.get("/search")
@@ -51,47 +183,13 @@ async def search_addresses(
     Returns:
         List of address search results with structured data
     """
-    if not q.strip():
+    q_norm = q.strip().lower()
+    if not q_norm:
         raise HTTPException(status_code=400, detail="Search query cannot be empty")
-
-    # Build Nominatim API URL
-    base_url = "https://nominatim.openstreetmap.org/search"
-    params = {
-        "q": q.strip(),
-        "format": "json",
-        "addressdetails": 1,
-        "limit": limit,
-        "extratags": 1,
-    }
-
-    if country_codes:
-        params["countrycodes"] = country_codes.strip()
+    cc_norm = (country_codes or "").strip().lower() or None
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(
-                base_url,
-                params=params,
-                headers={
-                    "User-Agent": "Dossier-App/1.0 (contact: admin@example.com)",  # Required by Nominatim
-                },
-            )
-            response.raise_for_status()
-
-            data = response.json()
-
-            # Convert to structured results
-            results = []
-            for item in data:
-                try:
-                    address_result = parse_nominatim_result(item)
-                    results.append(address_result.model_dump())
-                except (ValueError, KeyError):
-                    # Skip malformed results
-                    continue
-
-            return results
-
+        return await _nominatim_search(q_norm, limit, cc_norm)
     except httpx.TimeoutException:
         raise HTTPException(status_code=504, detail="Address search service timeout")
     except httpx.HTTPStatusError as e:
@@ -113,6 +211,10 @@ async def reverse_geocode(
 ) -> dict[str, Any]:
     """Reverse geocode coordinates to get address information.
 
+    Coordinates are rounded to 5 decimal places (about 1.1 m) before lookup and
+    the rounded values are what is sent to Nominatim. Nearby requests therefore
+    share a cache entry; the error is far below street-address resolution.
+
     Args:
         lat: Latitude
         lon: Longitude
@@ -131,44 +233,11 @@ async def reverse_geocode(
             detail="Longitude must be between -180 and 180",
         )
 
-    # Build Nominatim reverse API URL
-    base_url = "https://nominatim.openstreetmap.org/reverse"
-    params = {
-        "lat": lat,
-        "lon": lon,
-        "format": "json",
-        "addressdetails": 1,
-        "extratags": 1,
-    }
+    lat_q = round(lat, _COORD_PRECISION)
+    lon_q = round(lon, _COORD_PRECISION)
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(
-                base_url,
-                params=params,
-                headers={
-                    "User-Agent": "Dossier-App/1.0 (contact: admin@example.com)",
-                },
-            )
-            response.raise_for_status()
-
-            data = response.json()
-
-            if not data:
-                raise HTTPException(
-                    status_code=404,
-                    detail="No address found for these coordinates",
-                )
-
-            try:
-                address_result = parse_nominatim_result(data)
-                return address_result.model_dump()
-            except (ValueError, KeyError):
-                raise HTTPException(
-                    status_code=502,
-                    detail="Invalid response from geocoding service",
-                )
-
+        result = await _nominatim_reverse(lat_q, lon_q)
     except httpx.TimeoutException:
         raise HTTPException(status_code=504, detail="Reverse geocoding service timeout")
     except httpx.HTTPStatusError as e:
@@ -176,8 +245,20 @@ async def reverse_geocode(
             status_code=502,
             detail=f"Reverse geocoding service error: {e.response.status_code}",
         )
+    except (ValueError, KeyError):
+        raise HTTPException(
+            status_code=502,
+            detail="Invalid response from geocoding service",
+        )
     except Exception:
         raise HTTPException(
             status_code=500,
             detail="Internal server error during reverse geocoding",
         )
+
+    if result is None:
+        raise HTTPException(
+            status_code=404,
+            detail="No address found for these coordinates",
+        )
+    return result
@@ -1,31 +1,48 @@
 """Authentication and API key endpoints for Dossier API."""
 
+import asyncio
+import hashlib
 import os
 import secrets
 from typing import Annotated
 from uuid import UUID
 
+import jwt
+from async_lru import alru_cache
 from fastapi import APIRouter, Depends, HTTPException, Security, status
 from fastapi.security import (
     APIKeyHeader,
     OAuth2PasswordBearer,
     OAuth2PasswordRequestForm,
 )
-from jose import JWTError, jwt
+from jwt.exceptions import PyJWTError as JWTError
 from passlib.context import CryptContext
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from dossier.db import get_db
+from dossier.models import AsyncSessionLocal
 from dossier.models.users import User
 
 SECRET_KEY = os.getenv("DOSS_SECRET_KEY", "CHANGE_THIS_SECRET_KEY")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60
 TOKEN_TYPE_BEARER = "bearer"  # noqa: S105  (not a password; token type constant)
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# How long a resolved API key -> user lookup is reused before hitting the DB again
+API_KEY_CACHE_TTL = 60
+# Same for JWTs: a cached token skips both signature verification and the DB
+TOKEN_CACHE_TTL = 30
+
+# bcrypt cost is explicit so it can be tuned; hashing runs off the event loop
+BCRYPT_ROUNDS = 12
+
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    bcrypt__rounds=BCRYPT_ROUNDS,
+    deprecated="auto",
+)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 
@@ -55,20 +72,22 @@ class UserOut(BaseModel):
     email: EmailStr
     api_key: str | None
 
-    class Config:
-        """Pydantic ORM mode configuration."""
+    model_config = ConfigDict(from_attributes=True)
 
-        orm_mode = True
 
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a plain password against a hashed password in a worker thread."""
+    return await asyncio.to_thread(pwd_context.verify, plain_password, hashed_password)
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a plain password against a hashed password."""
-    return pwd_context.verify(plain_password, hashed_password)
 
+async def get_password_hash(password: str) -> str:
+    """Hash a password for storage in a worker thread."""
+    return await asyncio.to_thread(pwd_context.hash, password)
 
-def get_password_hash(password: str) -> str:
-    """Hash a password for storage."""
-    return pwd_context.hash(password)
+
+def hash_api_key(api_key: str) -> str:
+    """Return the SHA-256 hex digest used to store and look up an API key."""
+    return hashlib.sha256(api_key.encode()).hexdigest()
 
 
 def create_access_token(data: dict) -> str:
@@ -82,10 +101,14 @@ async def get_user_by_username(db: AsyncSession, username: str) -> User | None:
     return result.scalars().first()
 
 
-async def get_user_by_api_key(db: AsyncSession, api_key: str) -> User | None:
-    """Fetch a user by API key."""
-    result = await db.execute(select(User).where(User.api_key == api_key))
-    return result.scalars().first()
+@alru_cache(maxsize=1024, ttl=API_KEY_CACHE_TTL)
+async def _get_user_by_api_key_hash(api_key_hash: str) -> User | None:
+    """Fetch a user by API key hash in a short-lived session (cached briefly)."""
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(
+            select(User).where(User.api_key_hash == api_key_hash),
+        )
+        return result.scalars().first()
 
 
 @router.post("/register")
@@ -94,28 +117,37 @@ async def register(
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> UserOut:
     """Register a new user and return user info with API key."""
-    result = await db.execute(
-        User.__table__.select().where(
-            (User.username == user.username) | (User.email == user.email),
-        ),
+    hashed_password = await get_password_hash(user.password)
+    api_key = secrets.token_urlsafe(32)
+    # Single round trip: a unique-constraint conflict (username or email)
+    # inserts nothing and returns no row, without a racy pre-check SELECT.
+    stmt = (
+        pg_insert(User)
+        .values(
+            username=user.username,
+            email=user.email,
+            hashed_password=hashed_password,
+            api_key=api_key,
+            api_key_hash=hash_api_key(api_key),
+        )
+        .on_conflict_do_nothing()
+        .returning(User)
     )
-    if result.first():
+    result = await db.execute(stmt)
+    db_user = result.scalars().first()
+    if db_user is None:
         raise HTTPException(
             status_code=400,
             detail="Username or email already registered",
         )
-    hashed_password = get_password_hash(user.password)
-    api_key = secrets.token_urlsafe(32)
-    db_user = User(
-        username=user.username,
-        email=user.email,
-        hashed_password=hashed_password,
-        api_key=api_key,
-    )
-    db.add(db_user)
     await db.commit()
-    await db.refresh(db_user)
-    return db_user
+    # Trusted DB row: build the response without re-validating each field
+    return UserOut.model_construct(
+        id=db_user.id,
+        username=db_user.username,
+        email=db_user.email,
+        api_key=db_user.api_key,
+    )
 
 
 @router.post("/login")
@@ -125,50 +157,60 @@ async def login(
 ) -> Token:
     """Authenticate user and return JWT access token."""
     user = await get_user_by_username(db, form_data.username)
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    if not user or not await verify_password(form_data.password, user.hashed_password):
         raise HTTPException(status_code=401, detail="Incorrect username or password")
     access_token = create_access_token({"sub": str(user.id)})
     # use a constant to avoid hardcoded-literal lint warnings
-    return Token(access_token=access_token, token_type=TOKEN_TYPE_BEARER)
+    return Token.model_construct(
+        access_token=access_token,
+        token_type=TOKEN_TYPE_BEARER,
+    )
 
 
-async def get_current_user(
-    token: Annotated[str, Depends(oauth2_scheme)],
-    db: Annotated[AsyncSession, Depends(get_db)],
-) -> User:
-    """Get the current user from JWT token."""
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
+@alru_cache(maxsize=8192, ttl=TOKEN_CACHE_TTL)
+async def _get_user_by_token(token: str) -> User | None:
+    """Resolve a JWT to its user in a short-lived session (cached briefly).
+
+    Returns None if the token is invalid or its subject is not a known user.
+    """
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-    except JWTError as exc:
-        raise credentials_exception from exc
+    except JWTError:
+        return None
+    user_id = payload.get("sub")
+    if user_id is None:
+        return None
     # convert subject to UUID and query ORM model so we return a User instance
     try:
         user_uuid = UUID(user_id)
-    except ValueError as exc:
-        raise credentials_exception from exc
-    result = await db.execute(select(User).where(User.id == user_uuid))
-    user = result.scalars().first()
+    except (TypeError, ValueError):
+        return None
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(select(User).where(User.id == user_uuid))
+        return result.scalars().first()
+
+
+async def get_current_user(
+    token: Annotated[str, Depends(oauth2_scheme)],
+) -> User:
+    """Get the current user from JWT token."""
+    user = await _get_user_by_token(token)
     if user is None:
-        raise credentials_exception
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     return user
 
 
 async def get_current_user_by_api_key(
     api_key: Annotated[str, Security(api_key_header)],
-    db: Annotated[AsyncSession, Depends(get_db)],
 ) -> User:
     """Get the current user from API key header."""
     if not api_key:
         raise HTTPException(status_code=401, detail="API key missing")
-    user = await get_user_by_api_key(db, api_key)
+    user = await _get_user_by_api_key_hash(hash_api_key(api_key))
     if not user:
         raise HTTPException(status_code=401, detail="Invalid API key")
     return user
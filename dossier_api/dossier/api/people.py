@@ -5,32 +5,47 @@ This module exposes a Pydantic model used by the API and the
 """
 
 import asyncio
-import importlib.resources as pkg_resources
+import functools
 import json
+import multiprocessing
 import re
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any
 from uuid import UUID, uuid4
 
 from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel, EmailStr, Field, field_validator
-from sqlalchemy import select
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
+from sherlock_project.notify import QueryNotify
+from sherlock_project.sherlock import sherlock as sherlock_run
+from sqlalchemy import (
+    Boolean,
+    ColumnElement,
+    RowMapping,
+    Text,
+    cast,
+    false,
+    func,
+    lambda_stmt,
+    literal_column,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, array
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm.attributes import flag_modified
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from dossier.api.auth import get_current_user
+
+# Site data caches are shared with the sherlock router so that
+# /sherlock/reload also refreshes validation
+from dossier.api.sherlock import get_slug_to_name_map, load_site_data
 from dossier.db import AsyncSession, get_db
 from dossier.models import AsyncSessionLocal
 from dossier.models.people import Person
 from dossier.schemas import AddressSchema
 
-# Try to import sherlock helpers if installed in the environment
-try:  # pragma: no cover - optional dependency path
-    from sherlock_project.sherlock import sherlock as sherlock_run  # type: ignore
-    from sherlock_project.sites import SitesInformation  # type: ignore
-except Exception:  # pragma: no cover - missing dependency
-    sherlock_run = None  # type: ignore
-    SitesInformation = None  # type: ignore
-
 
 class PersonSchema(BaseModel):
     """Schema representing a person record returned by the API."""
@@ -67,10 +82,7 @@ class PersonSchema(BaseModel):
                 return v
         return v
 
-    class Config:
-        """Pydantic configuration for ORM mode."""
-
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PersonCreate(BaseModel):
@@ -95,29 +107,27 @@ class PersonCreate(BaseModel):
 
     def validate_at_least_one(self) -> None:
         """Require at least one non-empty field on create."""
-        has_any = any(
-            [
-                bool(self.first_name and self.first_name.strip()),
-                bool(self.last_name and self.last_name.strip()),
-                bool(self.email),
-                bool(self.phone_number and self.phone_number.strip()),
-                bool(
-                    self.address
-                    and (
-                        (
-                            self.address.display_name
-                            and self.address.display_name.strip()
-                        )
-                        or (self.address.road and self.address.road.strip())
-                        or (self.address.city and self.address.city.strip())
-                    ),
-                ),
-                bool(self.socials and len(self.socials) > 0),
-                bool(self.alternate_phones and len(self.alternate_phones) > 0),
-                bool(self.alternate_emails and len(self.alternate_emails) > 0),
-                bool(self.aliases and len(self.aliases) > 0),
-                bool(self.notes and self.notes.strip()),
-            ],
+        # Short-circuits on the first present field; cheap truthiness checks on
+        # optional containers come before string stripping and nested access.
+        address = self.address
+        has_any = bool(
+            self.email
+            or self.socials
+            or self.alternate_phones
+            or self.alternate_emails
+            or self.aliases
+            or (self.first_name and self.first_name.strip())
+            or (self.last_name and self.last_name.strip())
+            or (self.phone_number and self.phone_number.strip())
+            or (self.notes and self.notes.strip())
+            or (
+                address
+                and (
+                    (address.display_name and address.display_name.strip())
+                    or (address.road and address.road.strip())
+                    or (address.city and address.city.strip())
+                )
+            ),
         )
         if not has_any:
             raise ValueError(
@@ -141,16 +151,59 @@ class PersonUpdate(BaseModel):
     def validate_statuses(self) -> None:
         if not self.socials_status:
             return
-        allowed = {"confirmed", "rejected", "unknown"}
-        invalid = [k for k, v in self.socials_status.items() if v not in allowed]
-        if invalid:
-            raise ValueError(f"Invalid social status values for: {invalid}")
+        bad = next(
+            (
+                k
+                for k, v in self.socials_status.items()
+                if v not in {"confirmed", "rejected", "unknown"}
+            ),
+            None,
+        )
+        if bad is not None:
+            raise ValueError(f"Invalid social status value for: {bad}")
 
 
 router = APIRouter()
 
+# Columns backing PersonSchema; list_people selects only these so rows come back
+# as plain mappings without ORM instance construction or identity-map tracking.
+_PERSON_COLUMNS = tuple(getattr(Person, name) for name in PersonSchema.model_fields)
+
+# Concatenated name/email text searched by list_people. Literals are inlined so
+# the SQL matches the people_trgm_idx expression declared on Person and the
+# planner can use the index.
+_SEARCH_TEXT = (
+    func.coalesce(Person.first_name, literal_column("''"))
+    + literal_column("' '")
+    + func.coalesce(Person.last_name, literal_column("''"))
+    + literal_column("' '")
+    + func.coalesce(Person.email, literal_column("''"))
+)
+
+
+def _owned_person_stmt(person_id: UUID, user_id: UUID) -> StatementLambdaElement:
+    """Select one person owned by `user_id`, reusing the cached compiled SQL."""
+    return lambda_stmt(
+        lambda: select(Person).where(
+            (Person.id == person_id) & (Person.user_id == user_id),
+        ),
+    )
+
+
 # Sherlock-like slug pattern: lowercase letters, digits, underscore and hyphen
-_SOCIAL_SLUG_RE = re.compile(r"^[a-z0-9_-]+$")
+_SOCIAL_SLUG_RE = re.compile(r"[a-z0-9_-]+")
+
+
+def _first_invalid_social_key(socials: dict[str, Any]) -> Any | None:
+    """Return the first socials key that isn't a Sherlock-style slug, if any."""
+    return next(
+        (
+            k
+            for k in socials
+            if not (isinstance(k, str) and _SOCIAL_SLUG_RE.fullmatch(k))
+        ),
+        None,
+    )
 
 
 @router.get("/", response_model=list[PersonSchema])
@@ -158,21 +211,28 @@ async def list_people(
     q: str | None = None,
     db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
-) -> list[Person]:
+) -> Sequence[RowMapping]:
     """List people visible to the current user; optional q searches name/email."""
-    stmt = select(Person).where(Person.user_id == current_user.id)
-    if q:
+    user_id = current_user.id
+    if not q:
+        # hot path: reuse the cached compiled statement across requests
+        stmt = lambda_stmt(
+            lambda: select(*_PERSON_COLUMNS).where(Person.user_id == user_id),
+        )
+    elif len(q.split()) > 1:
+        # multi-word: every word must appear, in any field/order (GIN tsvector)
+        stmt = select(*_PERSON_COLUMNS).where(
+            (Person.user_id == user_id)
+            & Person.search_tsv.match(q, postgresql_regconfig="simple"),
+        )
+    else:
+        # single trigram-indexed ILIKE instead of one seq-scanned ILIKE per column
         like = f"%{q}%"
-        stmt = select(Person).where(
-            (Person.user_id == current_user.id)
-            & (
-                (Person.first_name.ilike(like))
-                | (Person.last_name.ilike(like))
-                | (Person.email.ilike(like))
-            ),
+        stmt = select(*_PERSON_COLUMNS).where(
+            (Person.user_id == user_id) & _SEARCH_TEXT.ilike(like),
         )
     result = await db.execute(stmt)
-    return result.scalars().all()
+    return result.mappings().all()
 
 
 @router.post("/", response_model=PersonSchema)
@@ -190,17 +250,13 @@ async def create_person(
 
     # if socials provided, enforce strict slug keys (reject non-slug keys)
     if person.socials:
-        invalid = [
-            k
-            for k in person.socials.keys()
-            if not (isinstance(k, str) and _SOCIAL_SLUG_RE.match(k))
-        ]
-        if invalid:
+        bad = _first_invalid_social_key(person.socials)
+        if bad is not None:
             raise HTTPException(
                 status_code=422,
                 detail=(
-                    "Invalid socials keys: %s. Keys must be Sherlock-style slugs: "
-                    "lowercase letters, digits, hyphen or underscore." % invalid
+                    f"Invalid socials key: {bad!r}. Keys must be Sherlock-style "
+                    "slugs: lowercase letters, digits, hyphen or underscore."
                 ),
             )
 
@@ -230,7 +286,11 @@ async def create_person(
         last_name=(person.last_name and person.last_name.strip()) or None,
         email=str(person.email) if person.email else None,
         phone_number=(person.phone_number and person.phone_number.strip()) or None,
-        address=(person.address.model_dump() if person.address else None),
+        address=(
+            person.address.model_dump(exclude_none=True, mode="json")
+            if person.address
+            else None
+        ),
         socials=person.socials,
         alternate_phones=person.alternate_phones,
         alternate_emails=person.alternate_emails,
@@ -239,9 +299,10 @@ async def create_person(
         user_id=current_user.id,
     )
     db.add(db_person)
+    # No refresh: the id is generated client-side and the response only uses
+    # columns we just set (the session keeps them after commit).
     try:
         await db.commit()
-        await db.refresh(db_person)
     except IntegrityError:
         await db.rollback()
         raise HTTPException(status_code=400, detail="Email already exists")
@@ -249,7 +310,9 @@ async def create_person(
     # Fire-and-forget background validation of socials with Sherlock if possible
     if db_person.socials:
         try:
-            asyncio.create_task(_validate_socials_with_sherlock(db_person.id))
+            asyncio.create_task(
+                _validate_socials_with_sherlock(db_person.id, db_person.socials),
+            )
         except Exception:
             # Non-fatal: if scheduling fails, just skip validation
             pass
@@ -258,64 +321,94 @@ async def create_person(
 
 # --- Sherlock validation helpers -------------------------------------------------
 
+# Cap concurrent background validations. Sherlock parses responses in Python,
+# so runs go to worker processes where they don't contend with request handlers
+# for the GIL; the pool is only started once a validation is actually needed.
+# The semaphore and the pool share one size so admitted runs never queue.
+_SHERLOCK_CONCURRENCY = 4
+_SHERLOCK_SEM = asyncio.Semaphore(_SHERLOCK_CONCURRENCY)
+_sherlock_pool: ProcessPoolExecutor | None = None
+# sherlock() requires a notifier; the base QueryNotify does nothing, so one
+# instance serves every run
+_QUERY_NOTIFY = QueryNotify()
+
+
+def _get_sherlock_pool() -> ProcessPoolExecutor:
+    """Return the Sherlock worker pool, starting it on first use."""
+    global _sherlock_pool  # noqa: PLW0603
+    if _sherlock_pool is None:
+        # Not fork: by now this process runs other threads (executors, the log
+        # listener), and forking a threaded process can deadlock the child.
+        _sherlock_pool = ProcessPoolExecutor(
+            max_workers=_SHERLOCK_CONCURRENCY,
+            mp_context=multiprocessing.get_context("forkserver"),
+        )
+    return _sherlock_pool
+
+
+def shutdown_sherlock_pool() -> None:
+    """Stop the Sherlock worker pool if it was started (application shutdown)."""
+    global _sherlock_pool  # noqa: PLW0603
+    if _sherlock_pool is not None:
+        _sherlock_pool.shutdown(wait=False, cancel_futures=True)
+        _sherlock_pool = None
+
 
 def _load_slug_to_name_map() -> dict[str, str]:
-    """Load sherlock providers data.json and return slug -> display name map.
+    """Return the shared slug -> display name map, or {} if unavailable.
 
-    Falls back to {} if the sherlock package/resources are unavailable.
+    The map is cached by dossier.api.sherlock; callers must not mutate it.
     """
     try:
-        data_file = pkg_resources.files("sherlock_project.resources").joinpath(
-            "data.json",
-        )
-        text = data_file.read_text(encoding="utf-8")
-        data = json.loads(text) if text else {}
-        out: dict[str, str] = {}
-        for slug, info in (data or {}).items():
-            if isinstance(info, dict):
-                name = info.get("name") or slug
-            else:
-                name = slug
-            out[str(slug)] = str(name)
-        return out
+        return get_slug_to_name_map()
     except Exception:
         return {}
 
 
-def _social_keys_to_site_names(socials: dict[str, Any]) -> list[str]:
-    """Convert our socials keys (slug or display) to Sherlock site display names."""
+def _social_keys_to_site_names(
+    socials: dict[str, Any],
+) -> tuple[list[str], dict[str, str]]:
+    """Convert our socials keys (slug or display) to Sherlock site display names.
+
+    Returns the unique site names in order and the socials key -> name mapping.
+    """
     sl2name = _load_slug_to_name_map()
-    names: list[str] = []
+    name_by_key: dict[str, str] = {}
+    # Deduplicate while preserving order
+    seen: set[str] = set()
+    unique: list[str] = []
     for key in socials:
         # Prefer slug->name mapping; else assume key is already a display name
         name = sl2name.get(key) or key
-        if isinstance(name, str):
-            names.append(name)
-    # Deduplicate while preserving order
-    seen: set[str] = set()
-    unique = []
-    for n in names:
-        if n not in seen:
-            seen.add(n)
-            unique.append(n)
-    return unique
+        name_by_key[key] = name
+        if isinstance(name, str) and name not in seen:
+            seen.add(name)
+            unique.append(name)
+    return unique, name_by_key
 
 
 def _pick_username_from_socials(socials: dict[str, Any]) -> str | None:
     """Pick a canonical username to validate: prefer the root social's handle."""
-    # socials values can be dicts {handle,status,root} or plain values
-    # 1) prefer root
+    # socials values can be dicts {handle,status,root} or plain values; a root
+    # handle wins immediately, otherwise fall back to the first non-empty one
+    first_handle = None
     for v in socials.values():
-        if isinstance(v, dict) and v.get("root") and v.get("handle"):
+        if isinstance(v, dict):
             h = str(v.get("handle") or "").strip()
-            if h:
+            if h and v.get("root"):
                 return h
-    # 2) else first non-empty handle
-    for v in socials.values():
-        h = str(v.get("handle")).strip() if isinstance(v, dict) else str(v).strip()
-        if h:
-            return h
-    return None
+        else:
+            h = str(v).strip()
+        if first_handle is None and h:
+            first_handle = h
+    return first_handle
+
+
+# Lookup tables for _interpret_sherlock_result
+_BOOL_KEYS = ("exists", "claimed", "found")
+_CONFIRMED = frozenset({"claimed", "found", "exists", "taken"})
+_REJECTED = frozenset({"available", "not found", "missing", "unknown"})
+_CODE_MAP = {200: "confirmed", 404: "rejected", 410: "rejected"}
 
 
 def _interpret_sherlock_result(res: dict[str, Any]) -> str:
@@ -326,7 +419,7 @@ def _interpret_sherlock_result(res: dict[str, Any]) -> str:
     if not isinstance(res, dict):
         return "unknown"
     # Common boolean hints
-    for key in ("exists", "claimed", "found"):
+    for key in _BOOL_KEYS:
         val = res.get(key)
         if isinstance(val, bool):
             return "confirmed" if val else "rejected"
@@ -334,93 +427,130 @@ def _interpret_sherlock_result(res: dict[str, Any]) -> str:
     status = res.get("status")
     if isinstance(status, str):
         s = status.lower()
-        if s in ("claimed", "found", "exists", "taken"):
+        if s in _CONFIRMED:
             return "confirmed"
-        if s in ("available", "not found", "missing", "unknown"):
+        if s in _REJECTED:
             return "rejected"
     # HTTP status hints
     code = res.get("status_code") or res.get("http_status")
     if isinstance(code, int):
-        if code == 200:
-            return "confirmed"
-        if code in (404, 410):
-            return "rejected"
+        return _CODE_MAP.get(code, "unknown")
     return "unknown"
 
 
-async def _validate_socials_with_sherlock(person_id: UUID) -> None:
-    """Background task: run Sherlock for chosen username, update socials statuses."""
-    # Open a fresh async DB session
-    async with AsyncSessionLocal() as session:
-        stmt = select(Person).where(Person.id == person_id)
-        res = await session.execute(stmt)
-        person = res.scalars().first()
-        if not person or not person.socials or sherlock_run is None:
-            return
+async def _validate_socials_with_sherlock(
+    person_id: UUID,
+    socials: dict[str, Any],
+) -> None:
+    """Background task: run Sherlock for chosen username, update socials statuses.
 
-        username = _pick_username_from_socials(person.socials)
-        if not username:
-            return
+    `socials` is the snapshot the caller just committed, so the person row is
+    not re-read; the only DB work is the final UPDATE.
+    """
+    if not socials:
+        return
 
-        site_names = _social_keys_to_site_names(person.socials)
-        if not site_names:
-            return
+    username = _pick_username_from_socials(socials)
+    if not username:
+        return
 
-        # Build site_data limited to our selection using SitesInformation
-        try:
-            # SitesInformation enumerates by display names
-            sites_obj = SitesInformation() if SitesInformation is not None else None
-            site_data_all = (
-                {site.name: site.information for site in sites_obj}
-                if sites_obj is not None
-                else {}
-            )
-            site_data = {
-                n: site_data_all.get(n) for n in site_names if n in site_data_all
-            }
-        except Exception:
-            site_data = {}
-        if not site_data:
-            return
+    site_names, name_by_key = _social_keys_to_site_names(socials)
+    if not site_names:
+        return
 
-        def blocking_call():
-            # Run Sherlock synchronously in a thread
-            return sherlock_run(  # type: ignore[misc]
-                username=username,
-                site_data=site_data,
-                query_notify=None,
-                timeout=60,
+    # Build site_data limited to our selection (per-run copies of cached data)
+    try:
+        site_data = await asyncio.to_thread(load_site_data, site_names)
+    except Exception:
+        site_data = {}
+    if not site_data:
+        return
+
+    # A partial of the module-level sherlock function pickles cleanly for the
+    # worker process, unlike a closure.
+    blocking_call = functools.partial(
+        sherlock_run,
+        username=username,
+        site_data=site_data,
+        query_notify=_QUERY_NOTIFY,
+        timeout=60,
+    )
+
+    try:
+        async with _SHERLOCK_SEM:
+            results = await asyncio.get_running_loop().run_in_executor(
+                _get_sherlock_pool(),
+                blocking_call,
             )
+    except Exception:
+        return
+
+    # Map results (by display name) back into status changes (by key)
+    statuses: dict[str, str] = {}
+    for key, name in name_by_key.items():
+        res = results.get(name) if isinstance(results, dict) else None
+        if isinstance(res, dict):
+            status = _interpret_sherlock_result(res)
+            if status != "unknown":
+                statuses[key] = status
+    if statuses:
+        # Only the status fields are written: socials edited while this run
+        # was queued must not be replaced by the snapshot taken at create time.
+        async with AsyncSessionLocal() as session:
+            await session.execute(
+                update(Person)
+                .where(Person.id == person_id)
+                .values(socials=_socials_with_statuses(statuses)),
+            )
+            await session.commit()
 
-        try:
-            results = await asyncio.to_thread(blocking_call)
-        except Exception:
-            return
 
-        # Map results (by display name) back into our socials (by key)
-        name_by_key = {
-            k: (_load_slug_to_name_map().get(k) or k) for k in person.socials.keys()
-        }
-        updated = False
-        new_socials: dict[str, Any] = dict(person.socials)
-        for key, name in name_by_key.items():
-            res = results.get(name) if isinstance(results, dict) else None
-            if not isinstance(new_socials.get(key), dict):
-                new_socials[key] = {
-                    "handle": new_socials.get(key),
-                    "status": "unknown",
-                    "root": False,
-                }
-            if isinstance(res, dict):
-                status = _interpret_sherlock_result(res)
-                if status != "unknown":
-                    new_socials[key]["status"] = status
-                    updated = True
-        if updated:
-            person.socials = new_socials
-            flag_modified(person, "socials")
-            session.add(person)
-            await session.commit()
+def _socials_with_statuses(statuses: dict[str, str]) -> ColumnElement:
+    """Return `Person.socials` with each platform's status set via jsonb_set.
+
+    Entries that are missing or not objects are left unchanged by jsonb_set.
+    """
+    socials_expr = Person.socials
+    for platform, status in statuses.items():
+        socials_expr = func.jsonb_set(
+            socials_expr,
+            cast(array([platform, "status"]), ARRAY(Text)),
+            func.to_jsonb(cast(status, Text)),
+        )
+    return socials_expr
+
+
+async def _set_social_statuses_in_db(
+    db: AsyncSession,
+    person_id: UUID,
+    user_id: UUID,
+    statuses: dict[str, str],
+) -> Person | None:
+    """Apply a status-only PATCH as a single UPDATE ... RETURNING.
+
+    Each status is written with jsonb_set, so the row is never loaded and
+    merged in Python. Returns None, writing nothing, unless the person exists,
+    every platform already has an object entry and no root profile is being
+    rejected; the caller then falls back to the regular update path, which
+    creates missing entries and reports errors.
+    """
+    conditions = [Person.id == person_id, Person.user_id == user_id]
+    for platform, status in statuses.items():
+        conditions.append(func.jsonb_typeof(Person.socials[platform]) == "object")
+        if status == "rejected":
+            is_root = cast(Person.socials[(platform, "root")].astext, Boolean)
+            conditions.append(func.coalesce(is_root, false()).is_(false()))
+
+    result = await db.execute(
+        update(Person)
+        .where(*conditions)
+        .values(socials=_socials_with_statuses(statuses))
+        .returning(Person),
+    )
+    person = result.scalars().first()
+    if person is not None:
+        await db.commit()
+    return person
 
 
 @router.get("/{person_id}", response_model=PersonSchema)
@@ -430,10 +560,7 @@ async def get_person(
     current_user=Depends(get_current_user),
 ) -> Person:
     """Fetch a single person by id, only if owned by the current user."""
-    stmt = select(Person).where(
-        (Person.id == person_id) & (Person.user_id == current_user.id),
-    )
-    result = await db.execute(stmt)
+    result = await db.execute(_owned_person_stmt(person_id, current_user.id))
     person = result.scalars().first()
     if not person:
         raise HTTPException(status_code=404, detail="Person not found")
@@ -453,10 +580,28 @@ async def update_person(
     except ValueError as e:
         raise HTTPException(status_code=422, detail=str(e))
 
-    stmt = select(Person).where(
-        (Person.id == person_id) & (Person.user_id == current_user.id),
+    # Fast path: a PATCH that only confirms/rejects existing socials is applied
+    # in SQL without loading the row first.
+    status_only = (
+        update.socials_status
+        and not update.socials
+        and update.first_name is None
+        and update.last_name is None
+        and update.email is None
+        and update.phone_number is None
+        and update.address is None
     )
-    result = await db.execute(stmt)
+    if status_only:
+        person = await _set_social_statuses_in_db(
+            db,
+            person_id,
+            current_user.id,
+            update.socials_status,
+        )
+        if person is not None:
+            return person
+
+    result = await db.execute(_owned_person_stmt(person_id, current_user.id))
     person = result.scalars().first()
     if not person:
         raise HTTPException(status_code=404, detail="Person not found")
@@ -477,28 +622,26 @@ async def update_person(
         ) or None
         changed = True
     if update.address is not None:
-        person.address = update.address.model_dump() if update.address else None
+        person.address = (
+            update.address.model_dump(exclude_none=True, mode="json")
+            if update.address
+            else None
+        )
         changed = True
 
-    # prepare a working copy of socials
-    socials = dict(person.socials or {})
+    # work on the loaded dict in place; flag_modified below marks the JSONB
+    # column dirty, and an error response rolls the session back anyway
+    socials = person.socials if isinstance(person.socials, dict) else {}
 
-    # handle adding/editing socials (merge semantics)
+    # handle adding/editing socials (merge semantics); keys are validated in the
+    # same pass, failing on the first bad one
     if update.socials:
-        # validate keys
-        invalid = [
-            k
-            for k in update.socials.keys()
-            if not (isinstance(k, str) and _SOCIAL_SLUG_RE.match(k))
-        ]
-        if invalid:
-            raise HTTPException(
-                status_code=422,
-                detail=f"Invalid socials keys: {invalid}",
-            )
-
-        # merge incoming socials
         for k, v in update.socials.items():
+            if not (isinstance(k, str) and _SOCIAL_SLUG_RE.fullmatch(k)):
+                raise HTTPException(
+                    status_code=422,
+                    detail=f"Invalid socials key: {k!r}",
+                )
             if isinstance(v, dict):
                 handle = v.get("handle") if v.get("handle") is not None else None
                 status = v.get("status") or "unknown"
@@ -545,12 +688,17 @@ async def update_person(
 
         changed = True
 
-    # ensure at least one root exists; if none, mark first social as root
-    if socials and not any(
-        bool(v.get("root")) for v in socials.values() if isinstance(v, dict)
-    ):
-        # pick first key
-        first_key = next(iter(socials))
+    # ensure at least one root exists; if none, mark first social as root.
+    # One pass finds both the first key and whether any root is present.
+    has_root = False
+    first_key = None
+    for k, v in socials.items():
+        if first_key is None:
+            first_key = k
+        if isinstance(v, dict) and v.get("root"):
+            has_root = True
+            break
+    if first_key is not None and not has_root:
         val = socials[first_key]
         if isinstance(val, dict):
             val["root"] = True
@@ -558,13 +706,11 @@ async def update_person(
         else:
             socials[first_key] = {"handle": val, "status": "unknown", "root": True}
 
+    # No refresh: nothing in the response is set server-side (search_tsv is
+    # deferred and not exposed) and the session keeps attributes after commit.
     if changed:
         person.socials = socials
         flag_modified(person, "socials")
-
-    if changed:
-        db.add(person)
         await db.commit()
-        await db.refresh(person)
 
     return person
@@ -1,41 +1,237 @@
 import asyncio
+import functools
 import importlib.resources as pkg_resources
 import json
 import logging
+import os
+import threading
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Annotated
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+import orjson
+import requests
+import sherlock_project.sherlock as sherlock_module
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.responses import ORJSONResponse
+from requests.adapters import DEFAULT_POOLBLOCK, HTTPAdapter
 from sherlock_project.notify import QueryNotify
 from sherlock_project.sherlock import sherlock as sherlock_run
 from sherlock_project.sites import SitesInformation
-from sqlalchemy import select
+from sqlalchemy import Text, case, cast, func, literal, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from urllib3.util import Retry
 
+from dossier.api.auth import get_current_user
 from dossier.db import get_db
 from dossier.models import AsyncSessionLocal
 from dossier.models.sherlock_jobs import SherlockJob, SherlockJobStatus
+from dossier.models.users import User
 
 # Set up logging for Sherlock operations
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/sherlock", tags=["sherlock"])
 
+# One set of connection pools shared by every Sherlock run in this process, so
+# connections to the ~400 probed sites are kept alive between runs. Sized for
+# one pool per site; retries are off because sherlock reports errors itself.
+# Each run still gets its own Session (and so its own cookie jar); only the
+# adapter holding the pools is shared.
+_SESSION_POOL_SIZE = 400
+_adapter: "_FixedPoolAdapter | None" = None
+_adapter_pid: int | None = None
+_adapter_lock = threading.Lock()
 
-def _load_site_data(selected: list[str] | None = None) -> dict:
+
+class _FixedPoolAdapter(HTTPAdapter):
+    """HTTPAdapter whose connection pools are sized once and outlive sessions.
+
+    sherlock's FuturesSession resizes the adapters of the session it is given
+    to its worker count on every run, which would discard the warm pools, and
+    closing any one run's Session must not close the pools the others use.
+    """
+
+    def init_poolmanager(
+        self,
+        connections: int,
+        maxsize: int,
+        block: bool = DEFAULT_POOLBLOCK,  # noqa: FBT001
+        **pool_kwargs: object,
+    ) -> None:
+        """Build the pool manager on the first call and ignore later resizes."""
+        if getattr(self, "poolmanager", None) is None:
+            super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+
+    def close(self) -> None:
+        """Keep the shared pools open when a run's Session is closed."""
+
+    def close_pools(self) -> None:
+        """Actually close the pooled connections (process shutdown)."""
+        super().close()
+
+
+def _get_shared_adapter() -> _FixedPoolAdapter:
+    """Return this process's shared adapter, creating it on first use.
+
+    The owning pid is tracked so forked worker processes build their own
+    pools instead of reusing sockets inherited from the parent.
+    """
+    global _adapter, _adapter_pid  # noqa: PLW0603
+    with _adapter_lock:
+        if _adapter is None or _adapter_pid != os.getpid():
+            _adapter = _FixedPoolAdapter(
+                pool_connections=_SESSION_POOL_SIZE,
+                pool_maxsize=_SESSION_POOL_SIZE,
+                max_retries=Retry(total=0),
+            )
+            _adapter_pid = os.getpid()
+        return _adapter
+
+
+def _new_session() -> requests.Session:
+    """Return a fresh Session that sends requests through the shared pools."""
+    adapter = _get_shared_adapter()
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def close_connection_pools() -> None:
+    """Close the shared Sherlock connection pools (application shutdown hook)."""
+    global _adapter, _adapter_pid  # noqa: PLW0603
+    with _adapter_lock:
+        if _adapter is not None and _adapter_pid == os.getpid():
+            _adapter.close_pools()
+        _adapter = None
+        _adapter_pid = None
+
+
+class _SharedSessionRequests:
+    """Stand-in for the `requests` module inside sherlock_project.sherlock.
+
+    sherlock() has no session parameter and calls requests.session() on every
+    run; this returns a session on the shared pools and forwards everything else.
+    """
+
+    def __getattr__(self, name: str) -> object:
+        return getattr(requests, name)
+
+    @staticmethod
+    def session() -> requests.Session:
+        """Return a new session backed by the shared connection pools."""
+        return _new_session()
+
+
+sherlock_module.requests = _SharedSessionRequests()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_sites_information() -> SitesInformation:
+    """Return the parsed Sherlock site list, loaded once until reloaded.
+
+    SitesInformation() fetches the site list over HTTP, so async code must
+    reach this (and everything built on it) through a worker thread.
+    """
+    return SitesInformation()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_all_site_data() -> dict:
+    """Return the raw site_data dict for every site, keyed by display name."""
+    # SitesInformation is iterable; build the raw site_data dict used by sherlock
+    return {site.name: site.information for site in _get_sites_information()}
+
+
+@functools.lru_cache(maxsize=1)
+def _get_site_names() -> frozenset[str]:
+    """Return the set of known site display names."""
+    return frozenset(_get_all_site_data())
+
+
+async def _reject_unknown_sites(sites: list[str] | None) -> None:
+    """Raise a 400 naming any requested sites Sherlock doesn't know."""
+    if not sites:
+        return
+    try:
+        # off the event loop: a cold cache loads the site list over HTTP
+        site_names = await asyncio.to_thread(_get_site_names)
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to load sherlock site data: {e}",
+        ) from e
+    unknown = [name for name in sites if name not in site_names]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown sherlock sites: {', '.join(unknown)}",
+        )
+
+
+def load_site_data(selected: list[str] | None = None) -> dict:
     """Load site data from the embedded Sherlock resources.
 
     Returns a mapping suitable to pass to sherlock(username, site_data, ...).
-    If `selected` is provided, it filters by exact display names.
+    If `selected` is provided, it filters by exact display names; unknown
+    names are dropped. Also used by social validation in dossier.api.people.
+
+    The per-site dicts are shallow copies: sherlock stores its request futures
+    in them, so runs must not share the cached originals.
     """
-    sites_obj = SitesInformation()
-    # SitesInformation is iterable; build the raw site_data dict used by sherlock
-    site_data_all = {site.name: site.information for site in sites_obj}
+    site_data_all = _get_all_site_data()
     if selected:
+        known = _get_site_names().intersection(selected)
         # keep ordering from selected list where possible
-        return {name: site_data_all[name] for name in selected if name in site_data_all}
-    return site_data_all
+        return {name: dict(site_data_all[name]) for name in selected if name in known}
+    return {name: dict(info) for name, info in site_data_all.items()}
+
+
+# The base QueryNotify only remembers the last result it was given, which we
+# never read, so one instance is shared by every run. Replace it here to hook
+# progress reporting into all Sherlock searches.
+_QUERY_NOTIFY = QueryNotify()
+
+# Options that are the same for every job; only the username, site data,
+# notifier and timeout vary per call.
+_sherlock_run_base = functools.partial(
+    sherlock_run,
+    tor=False,
+    unique_tor=False,
+    dump_response=False,
+    proxy=None,
+)
+
+# Sherlock runs block a thread for the whole scan, so they get their own
+# bounded pool rather than the loop's default executor used by to_thread.
+# The job worker claims at most this many jobs at once for the same reason.
+MAX_SHERLOCK_RUNS = 4
+_SHERLOCK_EXECUTOR = ThreadPoolExecutor(
+    max_workers=MAX_SHERLOCK_RUNS,
+    thread_name_prefix="sherlock",
+)
+
+# /reload sends NOTIFY on this channel so job workers drop their caches too
+RELOAD_CHANNEL = "sherlock_reload"
+
+# Identical /run requests share work: concurrent ones await the same in-flight
+# task, and finished results are reused for a short while.
+_RunKey = tuple[str, tuple[str, ...], int]
+_INFLIGHT: dict[_RunKey, asyncio.Task] = {}
+_RESULTS_TTL = 60
+_RESULTS_CACHE: TTLCache = TTLCache(maxsize=256, ttl=_RESULTS_TTL)
+
+
+def _finish_run(key: _RunKey, task: asyncio.Task) -> None:
+    """Drop a finished run from _INFLIGHT and cache its result if it succeeded."""
+    _INFLIGHT.pop(key, None)
+    # task.exception() also marks a failure as retrieved if no caller is left
+    if not task.cancelled() and task.exception() is None:
+        _RESULTS_CACHE[key] = task.result()
 
 
 @router.post("/run")
@@ -50,9 +246,40 @@ async def run_sherlock(
       the FastAPI event loop.
     - Returns the raw sherlock results dict (site -> result dict). You should
       post-process this on the backend to convert to your app's shape.
+    - Concurrent requests with the same arguments share one run, and results
+      are reused for 60 seconds.
     """
+    await _reject_unknown_sites(sites)
+    key = (username, tuple(sorted(sites or ())), timeout)
+    cached = _RESULTS_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    task = _INFLIGHT.get(key)
+    if task is None:
+        task = asyncio.create_task(_execute_run(username, sites, timeout))
+        _INFLIGHT[key] = task
+        task.add_done_callback(functools.partial(_finish_run, key))
+    # shield: a disconnecting caller must not cancel the run for the others
+    return await asyncio.shield(task)
+
+
+_BYTES_TYPES = (bytes, bytearray)
+
+
+def _decode_bytes(value: bytes | bytearray) -> str:
+    """Decode response bytes as UTF-8, falling back to latin-1."""
+    try:
+        return value.decode("utf-8")
+    except UnicodeDecodeError:
+        # latin-1 maps every byte, so this cannot fail
+        return value.decode("latin-1")
+
+
+async def _execute_run(username: str, sites: list[str] | None, timeout: int) -> dict:
+    """Run Sherlock once and return JSON-safe results (see run_sherlock)."""
     try:
-        site_data = _load_site_data(sites)
+        site_data = await asyncio.to_thread(load_site_data, sites)
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -62,7 +289,7 @@ async def run_sherlock(
     def blocking_call() -> dict:
         # QueryNotify is used for progress printing; use the plain QueryNotify
         # (it won't print to our API response, it's only internal)
-        qn = QueryNotify()
+        qn = _QUERY_NOTIFY
         return sherlock_run(
             username=username,
             site_data=site_data,
@@ -71,129 +298,219 @@ async def run_sherlock(
         )
 
     # Run in a thread to avoid blocking the async loop.
-    results = await asyncio.to_thread(blocking_call)
+    results = await asyncio.get_running_loop().run_in_executor(
+        _SHERLOCK_EXECUTOR,
+        blocking_call,
+    )
 
     # Clean up the results to ensure they're JSON serializable
-    # Sherlock results can contain response objects with bytes that aren't UTF-8
-    cleaned_results = {}
-    for site_name, result in results.items():
+    # Sherlock results can contain response objects with bytes that aren't UTF-8.
+    # The dicts are fresh from this run, so bytes are replaced in place; when
+    # there are none (the usual case) this is a read-only scan with no
+    # allocations, so no separate "any bytes?" pre-pass is needed.
+    for result in results.values():
         if isinstance(result, dict):
-            cleaned_result = {}
             for key, value in result.items():
-                if isinstance(value, bytes):
-                    # Try to decode as UTF-8, fallback to latin-1, or use repr()
-                    try:
-                        cleaned_result[key] = value.decode("utf-8")
-                    except UnicodeDecodeError:
-                        try:
-                            cleaned_result[key] = value.decode("latin-1")
-                        except UnicodeDecodeError:
-                            cleaned_result[key] = repr(value)
-                else:
-                    cleaned_result[key] = value
-            cleaned_results[site_name] = cleaned_result
-        else:
-            cleaned_results[site_name] = result
+                if type(value) in _BYTES_TYPES:
+                    result[key] = _decode_bytes(value)
 
     # Return cleaned results; caller can map slugs/display names to your app model.
-    return cleaned_results
+    return results
+
+
+def _job_result(result: dict) -> dict:
+    """Return the stored form of one sherlock site result.
+
+    Only small JSON-safe fields are kept: the QueryResult becomes its status
+    name and the response body is not stored at all.
+    """
+    status = result.get("status")
+    return {
+        "url_main": result.get("url_main"),
+        "url_user": result.get("url_user"),
+        "status": str(status.status) if status is not None else None,
+        "http_status": result.get("http_status"),
+    }
+
+
+# Final job writes are batched: finished jobs are queued here and a single
+# flusher task writes up to _JOB_UPDATE_BATCH of them per UPDATE, waiting at
+# most _JOB_UPDATE_LINGER seconds for a batch to fill.
+_JOB_UPDATE_BATCH = 50
+_JOB_UPDATE_LINGER = 0.2
+_FINAL_JOB_COLUMNS = (
+    "status",
+    "started_at",
+    "completed_at",
+    "results",
+    "error_message",
+)
+_job_updates: asyncio.Queue[tuple[str, dict]] = asyncio.Queue()
+_job_flusher: asyncio.Task | None = None
+
+
+async def _write_job_updates(updates: dict[str, dict]) -> None:
+    """Write final job values for several jobs with one UPDATE and commit.
+
+    Each column is set through a CASE on the job id; jobs that didn't set a
+    column keep its current value.
+    """
+    table = SherlockJob.__table__
+    values = {}
+    for name in _FINAL_JOB_COLUMNS:
+        column = table.c[name]
+        whens = {
+            job_id: literal(job_values[name], column.type)
+            for job_id, job_values in updates.items()
+            if name in job_values
+        }
+        if whens:
+            values[name] = case(whens, value=table.c.id, else_=column)
+
+    async with AsyncSessionLocal() as session:
+        await session.execute(
+            update(table).where(table.c.id.in_(list(updates))).values(values),
+        )
+        await session.commit()
+
+
+async def _flush_job_updates() -> None:
+    """Drain _job_updates forever, writing finished jobs in batches."""
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await _job_updates.get()]
+        deadline = loop.time() + _JOB_UPDATE_LINGER
+        while len(batch) < _JOB_UPDATE_BATCH:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(_job_updates.get(), remaining))
+            except TimeoutError:
+                break
+
+        try:
+            await _write_job_updates(dict(batch))
+        except Exception:
+            # don't let one bad row lose the whole batch; retry jobs one by one
+            logger.exception("Batched write of %d Sherlock jobs failed", len(batch))
+            for job_id, job_values in batch:
+                try:
+                    await _write_job_updates({job_id: job_values})
+                except Exception:
+                    logger.exception("Failed to write Sherlock job %s", job_id)
+        finally:
+            for _ in batch:
+                _job_updates.task_done()
+
+
+def _queue_job_update(job_id: str, values: dict) -> None:
+    """Queue a job's final values for the batch flusher, starting it if needed."""
+    global _job_flusher  # noqa: PLW0603
+    if _job_flusher is None or _job_flusher.done():
+        _job_flusher = asyncio.create_task(_flush_job_updates())
+    _job_updates.put_nowait((job_id, values))
+
+
+async def stop_job_flusher() -> None:
+    """Write any queued job updates and stop the flusher (application shutdown)."""
+    global _job_flusher  # noqa: PLW0603
+    if _job_flusher is None:
+        return
+    if not _job_flusher.done():
+        await _job_updates.join()
+    _job_flusher.cancel()
+    _job_flusher = None
 
 
 async def process_sherlock_job(job_id: str) -> None:
-    """Background task to process a sherlock job."""
-    logger.info("Starting Sherlock job processing for job_id: %s", job_id)
+    """Background task to process a sherlock job.
 
+    The worker marks the job RUNNING when it claims it; this only writes the
+    final state, once, through the batch flusher.
+    """
+    logger.debug("Starting Sherlock job processing for job_id: %s", job_id)
+
+    # Read the job and release the connection before the long-running search
     async with AsyncSessionLocal() as session:
         result = await session.execute(
             select(SherlockJob).where(SherlockJob.id == job_id),
         )
         job = result.scalar_one_or_none()
 
-        if not job:
-            logger.warning("Job %s not found in database", job_id)
-            return
+    if not job:
+        logger.warning("Job %s not found in database", job_id)
+        return
 
-        logger.info("Processing Sherlock search for username: %s", job.username)
+    logger.debug("Processing Sherlock search for username: %s", job.username)
+    values: dict = {"started_at": datetime.now(tz=timezone.utc)}
+    start_ns = time.perf_counter_ns()
 
-        try:
-            # Update status to running
-            job.status = SherlockJobStatus.RUNNING
-            job.started_at = datetime.now(tz=timezone.utc)
-            await session.commit()
-            logger.info("Job %s status updated to RUNNING", job_id)
-
-            # Run Sherlock search
-            logger.info("Starting Sherlock search for username: %s", job.username)
-            site_data = SitesInformation()
-            logger.info(
-                "Loaded Sherlock site data, searching %d sites",
-                len(site_data.sites),
-            )
+    try:
+        # Run Sherlock search
+        logger.debug("Starting Sherlock search for username: %s", job.username)
+        site_data = await asyncio.to_thread(load_site_data, job.sites)
+        logger.debug(
+            "Loaded Sherlock site data, searching %d sites",
+            len(site_data),
+        )
 
-            def run_sherlock_sync() -> dict:
-                """Run sherlock synchronously in a thread."""
-                return sherlock_run(
-                    username=job.username,
-                    site_data=site_data,
-                    verbose=False,
-                    tor=False,
-                    unique_tor=False,
-                    nsfw=False,
-                    csv=False,
-                    timeout=job.timeout or 10,
-                    print_all=False,
-                    print_found=False,
-                    no_color=True,
-                    browse=False,
-                    local=False,
-                )
-
-            # Execute Sherlock search in thread executor
-            logger.info("Executing Sherlock search in thread executor")
-            search_results = await asyncio.get_event_loop().run_in_executor(
-                None,
-                run_sherlock_sync,
+        def run_sherlock_sync() -> dict:
+            """Run sherlock synchronously in a thread."""
+            return _sherlock_run_base(
+                username=job.username,
+                site_data=site_data,
+                query_notify=_QUERY_NOTIFY,
+                timeout=job.timeout or 10,
             )
 
-            logger.info(
-                "Sherlock search completed, found %d total results",
-                len(search_results) if search_results else 0,
-            )
+        # Execute Sherlock search in thread executor
+        logger.debug("Executing Sherlock search in thread executor")
+        search_results = await asyncio.get_running_loop().run_in_executor(
+            _SHERLOCK_EXECUTOR,
+            run_sherlock_sync,
+        )
 
-            # Clean up the results - remove None values and empty entries
-            logger.info("Cleaning up Sherlock results")
-            cleaned_results = {}
-            if search_results:
-                for site_name, result_data in search_results.items():
-                    if result_data is not None and result_data.get("url_user"):
-                        cleaned_results[site_name] = result_data
-                        logger.debug(
-                            "Found account on %s: %s",
-                            site_name,
-                            result_data.get("url_user"),
-                        )
-
-            logger.info(
-                "Sherlock search completed successfully. Found %d valid accounts for %s",
-                len(cleaned_results),
-                job.username,
-            )
+        logger.debug(
+            "Sherlock search completed, found %d total results",
+            len(search_results) if search_results else 0,
+        )
 
-            # Update job with results
-            job.status = SherlockJobStatus.COMPLETED
-            job.results = cleaned_results
-            job.completed_at = datetime.now(tz=timezone.utc)
+        # Keep only hits, reduced to plain JSON values for the JSONB column;
+        # the raw page body (response_text) is dropped.
+        logger.debug("Cleaning up Sherlock results")
+        cleaned_results = {
+            site_name: _job_result(result_data)
+            for site_name, result_data in (search_results or {}).items()
+            if result_data and result_data.get("url_user")
+        }
 
-        except Exception as e:
-            logger.exception("Sherlock job %s failed", job_id)
-            job.status = SherlockJobStatus.FAILED
-            job.error_message = str(e)
-            job.completed_at = datetime.now(tz=timezone.utc)
+        logger.debug(
+            "Sherlock search completed successfully. Found %d valid accounts for %s",
+            len(cleaned_results),
+            job.username,
+        )
 
-        await session.commit()
-        logger.info("Job %s completed with status: %s", job_id, job.status)
-        if job.status == SherlockJobStatus.COMPLETED:
-            logger.info("Results summary: %d accounts found", len(job.results or {}))
+        # Record job results
+        values["status"] = SherlockJobStatus.COMPLETED
+        values["results"] = cleaned_results
+
+    except Exception as e:
+        logger.exception("Sherlock job %s failed", job_id)
+        values["status"] = SherlockJobStatus.FAILED
+        values["error_message"] = str(e)
+
+    # one timestamp for the completion transition, whichever branch ran
+    values["completed_at"] = datetime.now(tz=timezone.utc)
+    _queue_job_update(job_id, values)
+    logger.info(
+        "Job %s completed with status: %s in %.1f ms",
+        job_id,
+        values["status"],
+        (time.perf_counter_ns() - start_ns) / 1e6,
+    )
+    if values["status"] == SherlockJobStatus.COMPLETED:
+        logger.debug("Results summary: %d accounts found", len(values["results"]))
 
 
 @router.post("/queue")
@@ -203,10 +520,15 @@ async def queue_sherlock_search(
     sites: list[str] | None = None,
     timeout: int = 60,
     *,
-    background_tasks: BackgroundTasks,
     session: Annotated[AsyncSession, Depends(get_db)],
 ) -> dict:
-    """Queue a Sherlock search job to run in the background."""
+    """Queue a Sherlock search job to run in the background.
+
+    The job is picked up by a `dossier.worker.sherlock_worker` process, which
+    is notified of the insert by a database trigger.
+    """
+    await _reject_unknown_sites(sites)
+
     # Create job record
     job_id = str(uuid.uuid4())
     job = SherlockJob(
@@ -222,9 +544,6 @@ async def queue_sherlock_search(
     session.add(job)
     await session.commit()
 
-    # Queue the background task
-    background_tasks.add_task(process_sherlock_job, job_id)
-
     return {
         "job_id": job_id,
         "status": "queued",
@@ -236,10 +555,28 @@ async def queue_sherlock_search(
 async def get_sherlock_job_status(
     job_id: str,
     session: Annotated[AsyncSession, Depends(get_db)],
-) -> dict:
-    """Get the status and results of a Sherlock search job."""
-    result = await session.execute(select(SherlockJob).where(SherlockJob.id == job_id))
-    job = result.scalar_one_or_none()
+) -> Response:
+    """Get the status and results of a Sherlock search job.
+
+    Results are read as JSONB text and spliced into the orjson-encoded body,
+    so large result sets are never decoded into Python and re-encoded.
+    """
+    result = await session.execute(
+        select(
+            SherlockJob.id,
+            SherlockJob.person_id,
+            SherlockJob.username,
+            SherlockJob.sites,
+            SherlockJob.timeout,
+            SherlockJob.status,
+            SherlockJob.created_at,
+            SherlockJob.started_at,
+            SherlockJob.completed_at,
+            SherlockJob.error_message,
+            cast(SherlockJob.results, Text).label("results_json"),
+        ).where(SherlockJob.id == job_id),
+    )
+    job = result.one_or_none()
 
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
@@ -256,12 +593,19 @@ async def get_sherlock_job_status(
         "completed_at": job.completed_at.isoformat() if job.completed_at else None,
     }
 
-    if job.status == SherlockJobStatus.COMPLETED and job.results:
-        response["results"] = job.results
-    elif job.status == SherlockJobStatus.FAILED and job.error_message:
+    results_json = job.results_json
+    # empty results ({} or JSON null) are omitted, as before
+    if (
+        job.status == SherlockJobStatus.COMPLETED
+        and results_json
+        and results_json not in ("{}", "null")
+    ):
+        body = orjson.dumps(response)[:-1] + b',"results":' + results_json.encode()
+        return Response(content=body + b"}", media_type="application/json")
+    if job.status == SherlockJobStatus.FAILED and job.error_message:
         response["error"] = job.error_message
 
-    return response
+    return ORJSONResponse(response)
 
 
 @router.get("/queue")
@@ -272,7 +616,19 @@ async def list_sherlock_jobs(
     limit: int = 50,
 ) -> list[dict]:
     """List Sherlock search jobs, optionally filtered by person_id or status."""
-    query = select(SherlockJob).order_by(SherlockJob.created_at.desc()).limit(limit)
+    # Only the listed columns; sites/results JSONB payloads are never fetched
+    query = (
+        select(
+            SherlockJob.id,
+            SherlockJob.person_id,
+            SherlockJob.username,
+            SherlockJob.status,
+            SherlockJob.created_at,
+            SherlockJob.completed_at,
+        )
+        .order_by(SherlockJob.created_at.desc())
+        .limit(limit)
+    )
 
     if person_id:
         query = query.where(SherlockJob.person_id == person_id)
@@ -280,31 +636,76 @@ async def list_sherlock_jobs(
         query = query.where(SherlockJob.status == status)
 
     result = await session.execute(query)
-    jobs = result.scalars().all()
 
     return [
         {
-            "job_id": job.id,
-            "person_id": job.person_id,
-            "username": job.username,
-            "status": job.status,
-            "created_at": job.created_at.isoformat() if job.created_at else None,
-            "completed_at": job.completed_at.isoformat() if job.completed_at else None,
+            "job_id": job_id,
+            "person_id": job_person_id,
+            "username": username,
+            "status": job_status,
+            "created_at": created_at.isoformat() if created_at else None,
+            "completed_at": completed_at.isoformat() if completed_at else None,
         }
-        for job in jobs
+        for (
+            job_id,
+            job_person_id,
+            username,
+            job_status,
+            created_at,
+            completed_at,
+        ) in result.all()
     ]
 
 
-@router.get("/providers")
-def get_providers() -> dict:
-    """Return the raw Sherlock providers data.json as a dict.
+def clear_site_data_caches() -> None:
+    """Drop every cached view of the Sherlock site data in this process.
 
-    This uses the installed `sherlock_project` package resources when
-    available. If the package isn't present it will raise a 503.
+    This includes the data used by social validation in dossier.api.people.
     """
-    if pkg_resources is None:
-        raise HTTPException(status_code=503, detail="Sherlock package not available")
+    _get_sites_information.cache_clear()
+    _get_all_site_data.cache_clear()
+    _get_site_names.cache_clear()
+    _load_providers.cache_clear()
+    _load_providers_list.cache_clear()
+    get_slug_to_name_map.cache_clear()
+
+
+@router.post("/reload")
+async def reload_site_data(
+    current_user: Annotated[User, Depends(get_current_user)],
+    session: Annotated[AsyncSession, Depends(get_db)],
+) -> dict:
+    """Reload the cached Sherlock site data.
+
+    Clears this API process's caches and loads the site list again in a
+    worker thread, so searches never trigger the fetch on the event loop. It
+    also notifies RELOAD_CHANNEL so running job workers clear theirs. Other
+    API processes (e.g. multiple uvicorn workers) keep their caches until
+    restarted. Restricted to superusers.
+    """
+    if not current_user.is_superuser:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    clear_site_data_caches()
+    await session.execute(select(func.pg_notify(RELOAD_CHANNEL, "")))
+    await session.commit()
+    try:
+        await asyncio.to_thread(_get_site_names)
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to load sherlock site data: {e}",
+        ) from e
+    return {"message": "Sherlock site data reloaded"}
+
+
+# Browsers and proxies may reuse provider data for an hour; it only changes
+# with the installed sherlock package.
+_PROVIDERS_CACHE_CONTROL = "public, max-age=3600"
+
 
+@functools.cache
+def _load_providers() -> dict:
+    """Read and parse the providers data once; failures are not cached."""
     try:
         # read the bundled data.json resource directly from the package
         data_file = pkg_resources.files("sherlock_project.resources").joinpath(
@@ -314,24 +715,58 @@ def get_providers() -> dict:
         return json.loads(text)
     except Exception:
         # fallback: try to build from SitesInformation if available
-        try:
-            return _load_site_data(None)
-        except Exception as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to load sherlock providers: {e}",
-            )
+        return load_site_data(None)
+
+
+@functools.cache
+def _load_providers_list() -> list[dict]:
+    """Build the slug/name list from the cached providers data once."""
+    return [
+        {
+            "slug": slug,
+            "name": (info.get("name") if isinstance(info, dict) else None) or slug,
+        }
+        for slug, info in (_load_providers() or {}).items()
+    ]
+
+
+@functools.cache
+def get_slug_to_name_map() -> dict[str, str]:
+    """Return the provider slug -> display name map from the cached providers."""
+    out: dict[str, str] = {}
+    for slug, info in (_load_providers() or {}).items():
+        name = (info.get("name") if isinstance(info, dict) else None) or slug
+        out[str(slug)] = str(name)
+    return out
+
+
+@router.get("/providers")
+def get_providers(response: Response) -> dict:
+    """Return the raw Sherlock providers data.json as a dict.
+
+    This uses the installed `sherlock_project` package resources when
+    available. If the package isn't present it will raise a 503.
+    """
+    if pkg_resources is None:
+        raise HTTPException(status_code=503, detail="Sherlock package not available")
+
+    try:
+        data = _load_providers()
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to load sherlock providers: {e}",
+        )
+    response.headers["Cache-Control"] = _PROVIDERS_CACHE_CONTROL
+    return data
 
 
 @router.get("/providers/list")
-def get_providers_list() -> list[dict]:
+def get_providers_list(response: Response) -> list[dict]:
     """Return a lightweight list of providers: [{"slug": ..., "name": ...}, ...]
 
     Useful for autocomplete on the frontend.
     """
-    data = get_providers()
-    out: list[dict] = []
-    for slug, info in (data or {}).items():
-        name = info.get("name") if isinstance(info, dict) else None
-        out.append({"slug": slug, "name": name or slug})
-    return out
+    # validates availability and sets the Cache-Control header
+    get_providers(response)
+    return _load_providers_list()
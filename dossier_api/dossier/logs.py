@@ -0,0 +1,38 @@
+"""Logging helpers shared by the API server and worker processes."""
+
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+
+def start_queue_logging() -> QueueListener | None:
+    """Move the root logger's handlers behind a queue drained by a thread.
+
+    Log calls then only enqueue the record, so slow handlers (console, files)
+    never block the event loop. Returns the started listener, which the caller
+    stops on shutdown, or None if the root logger has no handlers to move.
+    """
+    root = logging.getLogger()
+    handlers = list(root.handlers)
+    if not handlers:
+        return None
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    for handler in handlers:
+        root.removeHandler(handler)
+    root.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+def stop_queue_logging(listener: QueueListener | None) -> None:
+    """Flush and stop a listener from start_queue_logging, restoring handlers."""
+    if listener is None:
+        return
+    listener.stop()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        if isinstance(handler, QueueHandler):
+            root.removeHandler(handler)
+    for handler in listener.handlers:
+        root.addHandler(handler)
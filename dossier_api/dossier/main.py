@@ -1,20 +1,41 @@
 """Entrypoint FastAPI application for the Dossier API."""
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Annotated
 
 from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from sqlalchemy import select
 
+from dossier.api import addresses, people, sherlock
 from dossier.api.addresses import router as addresses_router
 from dossier.api.auth import get_current_user, get_current_user_by_api_key
 from dossier.api.auth import router as auth_router
 from dossier.api.people import router as people_router
 from dossier.api.sherlock import router as sherlock_router
 from dossier.db import AsyncSession, get_db
+from dossier.logs import start_queue_logging, stop_queue_logging
 from dossier.models.users import User as ModelUser
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """Create shared HTTP clients on startup and close them on shutdown."""
+    log_listener = start_queue_logging()
+    await addresses.open_client()
+    try:
+        yield
+    finally:
+        await addresses.close_client()
+        people.shutdown_sherlock_pool()
+        await sherlock.stop_job_flusher()
+        sherlock.close_connection_pools()
+        stop_queue_logging(log_listener)
+
+
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # Allow CORS for frontend during development so preflight (OPTIONS) requests
 # succeed and don't return 405. For production, restrict origins appropriately.
@@ -2,9 +2,9 @@
 
 from uuid import uuid4
 
-from sqlalchemy import Column, ForeignKey, String
-from sqlalchemy.dialects.postgresql import JSONB, UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Computed, ForeignKey, Index, String, func, literal_column
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID
+from sqlalchemy.orm import deferred, relationship
 
 from . import Base
 
@@ -31,6 +31,37 @@ class Person(Base):
     alternate_emails = Column(JSONB, nullable=True)
     aliases = Column(JSONB, nullable=True)
     notes = Column(String, nullable=True)
+    # Generated full-text vector over name/email for multi-word search (GIN
+    # indexed). Deferred so regular person loads don't fetch it.
+    search_tsv = deferred(
+        Column(
+            TSVECTOR,
+            Computed(
+                "to_tsvector('simple', coalesce(first_name, '') || ' ' || "
+                "coalesce(last_name, '') || ' ' || coalesce(email, ''))",
+                persisted=True,
+            ),
+        ),
+    )
+
+    __table_args__ = (
+        # Trigram index for substring search; the expression must match the one
+        # list_people filters on (dossier.api.people._SEARCH_TEXT).
+        Index(
+            "people_trgm_idx",
+            (
+                func.coalesce(first_name, literal_column("''"))
+                + literal_column("' '")
+                + func.coalesce(last_name, literal_column("''"))
+                + literal_column("' '")
+                + func.coalesce(email, literal_column("''"))
+            ).label("search_text"),
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"},
+        ),
+        # Full-text index over the generated search_tsv column
+        Index("people_tsv_idx", "search_tsv", postgresql_using="gin"),
+    )
 
     # Relationships
     owner = relationship("User", back_populates="people")
@@ -1,9 +1,11 @@
 """Database models for Sherlock job queue system."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 
-from sqlalchemy import JSON, DateTime, String, Text
+from sqlalchemy import DateTime, Index, String, Text
+from sqlalchemy import Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from dossier.models import Base
@@ -30,11 +32,43 @@ class SherlockJob(Base):
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
     person_id: Mapped[str | None] = mapped_column(String(36), nullable=True)
     username: Mapped[str] = mapped_column(String(255), nullable=False)
-    sites: Mapped[list[str] | None] = mapped_column(JSON, nullable=True)
+    sites: Mapped[list[str] | None] = mapped_column(JSONB, nullable=True)
     timeout: Mapped[int] = mapped_column(default=60)
-    status: Mapped[SherlockJobStatus] = mapped_column(default=SherlockJobStatus.PENDING)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    started_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
-    completed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
-    results: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    # Typed explicitly (same type the annotation implies) so the partial index
+    # below can render its enum literals while the class body is evaluated
+    status: Mapped[SherlockJobStatus] = mapped_column(
+        SQLEnum(SherlockJobStatus),
+        default=SherlockJobStatus.PENDING,
+    )
+    # timestamptz columns: declared with timezone=True so bound values (e.g. in
+    # the batched CASE update) are sent as TIMESTAMP WITH TIME ZONE
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(tz=timezone.utc),
+    )
+    started_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+    completed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+    results: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    __table_args__ = (
+        # Job listing, newest first
+        Index("ix_sherlock_jobs_created_at", created_at.desc()),
+        # Per-person listing; also serves plain person_id lookups
+        Index("ix_sherlock_jobs_person_created", person_id, created_at.desc()),
+        # Partial: most rows end up COMPLETED/FAILED, only open jobs are indexed
+        Index(
+            "ix_sherlock_jobs_status_created",
+            status,
+            created_at.desc(),
+            postgresql_where=status.in_(
+                [SherlockJobStatus.PENDING, SherlockJobStatus.RUNNING],
+            ),
+        ),
+    )
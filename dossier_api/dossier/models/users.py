@@ -24,6 +24,8 @@ class User(Base):
     profile_data = Column(JSONB, nullable=True)
 
     api_key = Column(String, unique=True, index=True, nullable=True)
+    # SHA-256 hex digest of api_key; API key authentication looks users up by this
+    api_key_hash = Column(String(64), unique=True, index=True, nullable=True)
 
     # Relationships
     people = relationship("Person", back_populates="owner")
@@ -0,0 +1 @@
+"""Background worker processes that run outside the API server."""
@@ -0,0 +1,176 @@
+"""Worker process that runs queued Sherlock jobs.
+
+Jobs are rows in `sherlock_jobs`. An insert trigger sends
+`NOTIFY sherlock_jobs`; this worker LISTENs for it, claims pending rows with
+`SELECT ... FOR UPDATE SKIP LOCKED` and runs them, so any number of workers can
+share the queue without running a job twice. The API server only inserts rows.
+
+Jobs left RUNNING by a worker that died are put back to PENDING once they are
+older than their timeout plus STALE_JOB_GRACE. `POST /sherlock/reload` also
+reaches workers: they LISTEN on its channel and clear their site data caches.
+
+Run with::
+
+    python -m dossier.worker.sherlock_worker
+"""
+
+import asyncio
+import contextlib
+import logging
+import signal
+from datetime import datetime, timezone
+
+import asyncpg
+from sqlalchemy import Select, func, select, update
+
+from dossier.api.sherlock import (
+    MAX_SHERLOCK_RUNS,
+    RELOAD_CHANNEL,
+    clear_site_data_caches,
+    process_sherlock_job,
+    stop_job_flusher,
+)
+from dossier.logs import start_queue_logging, stop_queue_logging
+from dossier.models import DATABASE_URL, AsyncSessionLocal
+from dossier.models.sherlock_jobs import SherlockJob, SherlockJobStatus
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "sherlock_jobs"
+# Jobs run concurrently by one worker process; more would only queue behind
+# the Sherlock thread pool while already marked RUNNING.
+MAX_CONCURRENT_JOBS = MAX_SHERLOCK_RUNS
+# A RUNNING job claimed longer ago than its timeout plus this many seconds is
+# assumed lost (its worker was killed) and is queued again.
+STALE_JOB_GRACE = 600
+# Look for pending jobs this often even without a notification, so jobs
+# inserted while the worker was down (or notifications lost on reconnect) run.
+POLL_INTERVAL = 30.0
+
+
+async def requeue_stale_jobs() -> int:
+    """Put RUNNING jobs whose worker has gone away back to PENDING.
+
+    A job's claim time is its started_at; rows claimed before that was
+    recorded fall back to created_at.
+    """
+    claimed_at = func.coalesce(SherlockJob.started_at, SherlockJob.created_at)
+    deadline = func.now() - func.make_interval(
+        0, 0, 0, 0, 0, 0, SherlockJob.timeout + STALE_JOB_GRACE,
+    )
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(
+            update(SherlockJob)
+            .where(
+                SherlockJob.status == SherlockJobStatus.RUNNING,
+                claimed_at < deadline,
+            )
+            .values(status=SherlockJobStatus.PENDING, started_at=None),
+        )
+        await session.commit()
+    if result.rowcount:
+        logger.warning("Re-queued %d stale Sherlock jobs", result.rowcount)
+    return result.rowcount
+
+
+def pending_jobs_query(limit: int) -> Select:
+    """Return the query that locks up to `limit` pending jobs, oldest first."""
+    return (
+        select(SherlockJob.id)
+        .where(SherlockJob.status == SherlockJobStatus.PENDING)
+        .order_by(SherlockJob.created_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+
+
+async def claim_jobs(limit: int) -> list[str]:
+    """Mark up to `limit` pending jobs RUNNING and return their ids.
+
+    SKIP LOCKED lets concurrent workers claim disjoint sets of rows. The
+    claim time is recorded in started_at so stale claims can be detected.
+    """
+    if limit <= 0:
+        return []
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(pending_jobs_query(limit))
+        job_ids = list(result.scalars().all())
+        if job_ids:
+            await session.execute(
+                update(SherlockJob)
+                .where(SherlockJob.id.in_(job_ids))
+                .values(
+                    status=SherlockJobStatus.RUNNING,
+                    started_at=datetime.now(tz=timezone.utc),
+                ),
+            )
+        await session.commit()
+    return job_ids
+
+
+async def run() -> None:
+    """Listen for new jobs and process them until cancelled."""
+    wakeup = asyncio.Event()
+    running: set[asyncio.Task] = set()
+
+    def on_notify(*_args: object) -> None:
+        wakeup.set()
+
+    def on_reload(*_args: object) -> None:
+        logger.info("Reloading Sherlock site data")
+        clear_site_data_caches()
+
+    conn = await asyncpg.connect(DATABASE_URL.replace("+asyncpg", ""))
+    await conn.add_listener(CHANNEL, on_notify)
+    await conn.add_listener(RELOAD_CHANNEL, on_reload)
+    logger.info("Listening for Sherlock jobs on channel %r", CHANNEL)
+
+    try:
+        while True:
+            wakeup.clear()
+            await requeue_stale_jobs()
+            for job_id in await claim_jobs(MAX_CONCURRENT_JOBS - len(running)):
+                task = asyncio.create_task(process_sherlock_job(job_id))
+                running.add(task)
+                # a finished job frees a slot, so look for more work
+                task.add_done_callback(running.discard)
+                task.add_done_callback(lambda _task: wakeup.set())
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(wakeup.wait(), POLL_INTERVAL)
+    finally:
+        await conn.remove_listener(CHANNEL, on_notify)
+        await conn.remove_listener(RELOAD_CHANNEL, on_reload)
+        await conn.close()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+        await stop_job_flusher()
+
+
+async def serve() -> None:
+    """Run the worker until SIGTERM or SIGINT.
+
+    Either signal cancels run(), whose cleanup waits for the jobs in progress
+    and flushes their final state before the process exits; without this a
+    plain SIGTERM would kill the process with results still queued in memory.
+    """
+    main_task = asyncio.current_task()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, main_task.cancel)
+    await run()
+
+
+def main() -> None:
+    """Entry point for `python -m dossier.worker.sherlock_worker`."""
+    logging.basicConfig(level=logging.INFO)
+    log_listener = start_queue_logging()
+    try:
+        asyncio.run(serve())
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        logger.info("Sherlock worker stopped")
+    finally:
+        stop_queue_logging(log_listener)
+
+
+if __name__ == "__main__":
+    main()
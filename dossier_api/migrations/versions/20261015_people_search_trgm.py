@@ -0,0 +1,26 @@
+"""
+Add trigram index for people name/email search
+
+Revision ID: 20261015_people_search_trgm
+Revises: 20261015_users_api_key_hash
+Create Date: 2026-10-15 00:00:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+
+revision: str = '20261015_people_search_trgm'
+down_revision: Union[str, Sequence[str], None] = '20261015_users_api_key_hash'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Must match the expression list_people filters on (dossier.api.people)
+    op.execute(
+        "CREATE INDEX people_trgm_idx ON people USING gin ("
+        "(coalesce(first_name, '') || ' ' || coalesce(last_name, '') || ' ' "
+        "|| coalesce(email, '')) gin_trgm_ops)"
+    )
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS people_trgm_idx")
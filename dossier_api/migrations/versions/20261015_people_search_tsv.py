@@ -0,0 +1,26 @@
+"""
+Add generated tsvector column for people full-text search
+
+Revision ID: 20261015_people_search_tsv
+Revises: 20261015_people_search_trgm
+Create Date: 2026-10-15 00:00:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+
+revision: str = '20261015_people_search_tsv'
+down_revision: Union[str, Sequence[str], None] = '20261015_people_search_trgm'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE people ADD COLUMN search_tsv tsvector GENERATED ALWAYS AS ("
+        "to_tsvector('simple', coalesce(first_name, '') || ' ' || "
+        "coalesce(last_name, '') || ' ' || coalesce(email, ''))) STORED"
+    )
+    op.execute("CREATE INDEX people_tsv_idx ON people USING gin (search_tsv)")
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS people_tsv_idx")
+    op.execute("ALTER TABLE people DROP COLUMN IF EXISTS search_tsv")
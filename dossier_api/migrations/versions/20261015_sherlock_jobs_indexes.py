@@ -0,0 +1,40 @@
+"""
+Index sherlock_jobs for the job listing and worker queries
+
+Revision ID: 20261015_sherlock_jobs_indexes
+Revises: 20261015_sherlock_jobs_notify
+Create Date: 2026-10-15 00:00:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '20261015_sherlock_jobs_indexes'
+down_revision: Union[str, Sequence[str], None] = '20261015_sherlock_jobs_notify'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade() -> None:
+    # Mirrors SherlockJob.__table_args__ (dossier.models.sherlock_jobs)
+    op.create_index(
+        'ix_sherlock_jobs_created_at', 'sherlock_jobs', [sa.text('created_at DESC')]
+    )
+    # also serves plain person_id lookups, so no separate person_id index
+    op.create_index(
+        'ix_sherlock_jobs_person_created',
+        'sherlock_jobs',
+        ['person_id', sa.text('created_at DESC')],
+    )
+    # partial: most rows end up COMPLETED/FAILED, only open jobs are indexed
+    # (the enum stores member names)
+    op.create_index(
+        'ix_sherlock_jobs_status_created',
+        'sherlock_jobs',
+        ['status', sa.text('created_at DESC')],
+        postgresql_where=sa.text("status IN ('PENDING', 'RUNNING')"),
+    )
+
+def downgrade() -> None:
+    op.drop_index('ix_sherlock_jobs_status_created', table_name='sherlock_jobs')
+    op.drop_index('ix_sherlock_jobs_person_created', table_name='sherlock_jobs')
+    op.drop_index('ix_sherlock_jobs_created_at', table_name='sherlock_jobs')
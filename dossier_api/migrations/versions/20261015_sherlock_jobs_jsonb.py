@@ -0,0 +1,28 @@
+"""
+Store sherlock_jobs sites and results as jsonb
+
+Revision ID: 20261015_sherlock_jobs_jsonb
+Revises: 20261015_sherlock_jobs_indexes
+Create Date: 2026-10-15 00:00:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+
+revision: str = '20261015_sherlock_jobs_jsonb'
+down_revision: Union[str, Sequence[str], None] = '20261015_sherlock_jobs_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE sherlock_jobs "
+        "ALTER COLUMN results TYPE jsonb USING results::jsonb, "
+        "ALTER COLUMN sites TYPE jsonb USING sites::jsonb"
+    )
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE sherlock_jobs "
+        "ALTER COLUMN results TYPE json USING results::json, "
+        "ALTER COLUMN sites TYPE json USING sites::json"
+    )
@@ -0,0 +1,29 @@
+"""
+Notify sherlock workers when a job is inserted
+
+Revision ID: 20261015_sherlock_jobs_notify
+Revises: 20261015_people_search_tsv
+Create Date: 2026-10-15 00:00:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+
+revision: str = '20261015_sherlock_jobs_notify'
+down_revision: Union[str, Sequence[str], None] = '20261015_people_search_tsv'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE OR REPLACE FUNCTION notify_sherlock_job() RETURNS trigger AS $$ "
+        "BEGIN PERFORM pg_notify('sherlock_jobs', NEW.id); RETURN NEW; END; "
+        "$$ LANGUAGE plpgsql"
+    )
+    op.execute(
+        "CREATE TRIGGER sherlock_jobs_notify AFTER INSERT ON sherlock_jobs "
+        "FOR EACH ROW EXECUTE FUNCTION notify_sherlock_job()"
+    )
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS sherlock_jobs_notify ON sherlock_jobs")
+    op.execute("DROP FUNCTION IF EXISTS notify_sherlock_job()")
@@ -0,0 +1,28 @@
+"""
+Add hashed API key column to users
+
+Revision ID: 20261015_users_api_key_hash
+Revises: 20250911_init
+Create Date: 2026-10-15 00:00:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '20261015_users_api_key_hash'
+down_revision: Union[str, Sequence[str], None] = '20250911_init'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column('api_key_hash', sa.String(length=64), nullable=True))
+    # Backfill existing keys with the same digest the API computes (sha256 hex)
+    op.execute(
+        "UPDATE users SET api_key_hash = encode(sha256(convert_to(api_key, 'UTF8')), 'hex') "
+        "WHERE api_key IS NOT NULL"
+    )
+    op.create_index(op.f('ix_users_api_key_hash'), 'users', ['api_key_hash'], unique=True)
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_users_api_key_hash'), table_name='users')
+    op.drop_column('users', 'api_key_hash')
@@ -0,0 +1,43 @@
+"""Smoke tests for the Sherlock worker entry point.
+
+Run with::
+
+    python -m unittest discover tests
+"""
+
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Runs in a fresh interpreter so models imported by other code (e.g. the API
+# app) can't hide a model the worker itself never registers.
+WORKER_ONLY = """
+from sqlalchemy.dialects import postgresql
+
+from dossier.worker.sherlock_worker import pending_jobs_query
+
+print(pending_jobs_query(4).compile(dialect=postgresql.asyncpg.dialect()))
+"""
+
+
+class WorkerImportTest(unittest.TestCase):
+    """The worker must run its queries when imported on its own."""
+
+    def test_claim_query_compiles_with_only_the_worker_imported(self) -> None:
+        """Mappers configure and the claim query compiles in a bare process."""
+        proc = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", WORKER_ONLY],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        self.assertEqual(proc.returncode, 0, proc.stderr)
+        self.assertIn("FOR UPDATE SKIP LOCKED", proc.stdout)
+
+
+if __name__ == "__main__":
+    unittest.main()